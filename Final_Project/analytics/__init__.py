@@ -0,0 +1,5 @@
+from .score_snapshot import ScoreSnapshot
+from .score_snapshot import get_snapshot
+from .score_snapshot import refresh_snapshot
+from .score_snapshot import mark_snapshot_stale
+from .score_snapshot import refresh_snapshot_periodically
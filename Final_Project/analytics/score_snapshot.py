@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sqlmodel import Session, select
+
+from database.database import engine
+from database.models.student import Student
+from schemas.subject import Subject
+
+SNAPSHOT_TTL_SECONDS = 60
+SNAPSHOT_POLL_SECONDS = 1
+
+logger = logging.getLogger('uvicorn.error')
+
+
+class ScoreSnapshot:
+    """Columnar, read-only copy of the student scores used for analytic queries.
+
+    Rows are sorted by student_id so a student can be located with a binary search,
+    scores are float64 arrays with NaN for missing values and home_town is
+    dictionary-encoded into integer codes over the sorted hometown names.
+    """
+
+    def __init__(self, student_ids: np.ndarray, home_town_codes: np.ndarray, home_towns: np.ndarray,
+                 scores: dict[Subject, np.ndarray], refreshed_at: datetime | None = None):
+        self.student_ids = student_ids
+        self.home_town_codes = home_town_codes
+        self.home_towns = home_towns
+        self.scores = scores
+        # scored values of each subject in ascending order, used to rank with a binary search
+        self.sorted_scores = {subject: np.sort(column[~np.isnan(column)]) for subject, column in scores.items()}
+        self.refreshed_at = refreshed_at or datetime.now(timezone.utc)
+
+    @classmethod
+    def load(cls, session: Session) -> "ScoreSnapshot":
+        refreshed_at = datetime.now(timezone.utc)
+        statement = select(
+            Student.student_id,
+            Student.home_town,
+            *(getattr(Student, subject.value) for subject in Subject),
+        ).order_by(Student.student_id)
+        frame = pd.read_sql(statement, session.connection())
+
+        home_town_codes, home_towns = pd.factorize(frame["home_town"], sort=True)
+        scores = {
+            subject: frame[subject.value].to_numpy(dtype=np.float64, na_value=np.nan)
+            for subject in Subject
+        }
+        return cls(
+            frame["student_id"].to_numpy(dtype=str),
+            home_town_codes.astype(np.int32),
+            np.asarray(home_towns, dtype=str),
+            scores,
+            refreshed_at
+        )
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def index_of(self, student_id: str) -> int | None:
+        index = int(np.searchsorted(self.student_ids, student_id))
+        if index < len(self.student_ids) and self.student_ids[index] == student_id:
+            return index
+        return None
+
+    def home_town_mask(self, home_town: str | None) -> np.ndarray | None:
+        """Row mask for a hometown, None when no filter is requested."""
+        if home_town is None:
+            return None
+        code = int(np.searchsorted(self.home_towns, home_town))
+        if code < len(self.home_towns) and self.home_towns[code] == home_town:
+            return self.home_town_codes == code
+        return np.zeros(len(self), dtype=bool)
+
+    def rank(self, student_id: str, subject: Subject) -> tuple[float, int, float, int] | None:
+        """Return (score, rank, percentile, total) or None when the student has no score."""
+        index = self.index_of(student_id)
+        if index is None:
+            return None
+        score = self.scores[subject][index]
+        if np.isnan(score):
+            return None
+        scored = self.sorted_scores[subject]
+        at_or_below = int(np.searchsorted(scored, score, side="right"))
+        rank = len(scored) - at_or_below + 1
+        percentile = at_or_below * 100 / len(scored)
+        return float(score), rank, percentile, len(scored)
+
+    def histogram(self, subject: Subject, bins: int, low: float, high: float,
+                  home_town: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+        if home_town is None:
+            return np.histogram(self.sorted_scores[subject], bins=bins, range=(low, high))
+        column = self.scores[subject]
+        mask = ~np.isnan(column) & self.home_town_mask(home_town)
+        return np.histogram(column[mask], bins=bins, range=(low, high))
+
+    def top(self, subject: Subject, n: int, home_town: str | None = None) -> np.ndarray:
+        """Row indices of the n best scores, ordered by score descending then student_id."""
+        column = self.scores[subject]
+        mask = ~np.isnan(column)
+        town_mask = self.home_town_mask(home_town)
+        if town_mask is not None:
+            mask &= town_mask
+        candidates = np.flatnonzero(mask)
+        if n < len(candidates):
+            # keep every row tied with the n-th best score so the final ordering is stable
+            threshold = np.partition(column[candidates], len(candidates) - n)[len(candidates) - n]
+            candidates = candidates[column[candidates] >= threshold]
+        # rows are already sorted by student_id, so a stable sort breaks ties on it
+        order = np.argsort(-column[candidates], kind="stable")
+        return candidates[order][:n]
+
+
+_snapshot: ScoreSnapshot | None = None
+_snapshot_version = 0
+_loaded_at = 0.0
+_version = 0
+_lock = threading.Lock()
+
+
+def mark_snapshot_stale() -> None:
+    """Record a write to the students table so the next refresh cycle rebuilds the snapshot."""
+    global _version
+    with _lock:
+        _version += 1
+
+
+def snapshot_is_stale() -> bool:
+    with _lock:
+        return (_snapshot is None
+                or _snapshot_version != _version
+                or time.monotonic() - _loaded_at > SNAPSHOT_TTL_SECONDS)
+
+
+def refresh_snapshot(session: Session) -> ScoreSnapshot:
+    """Rebuild the snapshot from the database and swap it in.
+
+    The load runs without holding the lock, so readers keep using the previous snapshot meanwhile.
+    """
+    global _snapshot, _snapshot_version, _loaded_at
+    with _lock:
+        version = _version
+    snapshot = ScoreSnapshot.load(session)
+    with _lock:
+        if _snapshot is None or snapshot.refreshed_at >= _snapshot.refreshed_at:
+            _snapshot = snapshot
+            _snapshot_version = version
+            _loaded_at = time.monotonic()
+        return _snapshot
+
+
+def get_snapshot(session: Session) -> ScoreSnapshot:
+    """Return the current snapshot, building it only when none exists yet."""
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = refresh_snapshot(session)
+    return snapshot
+
+
+async def refresh_snapshot_periodically() -> None:
+    """Background loop rebuilding the snapshot after writes or once it is older than the TTL."""
+    while True:
+        if snapshot_is_stale():
+            try:
+                await asyncio.to_thread(_refresh_with_new_session)
+            except Exception as err:
+                logger.error(f"Analytic snapshot refresh failed: {err}")
+        await asyncio.sleep(SNAPSHOT_POLL_SECONDS)
+
+
+def _refresh_with_new_session() -> None:
+    with Session(engine) as session:
+        refresh_snapshot(session)
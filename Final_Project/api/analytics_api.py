@@ -0,0 +1,115 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from starlette import status
+
+from analytics import get_snapshot, refresh_snapshot
+from database import get_session
+from schemas import Subject, StudentRankResponse, HistogramBin, HistogramResponse, TopStudent, \
+    TopStudentsResponse, SnapshotResponse
+
+router = APIRouter(
+    prefix='/v1/api/analytics'
+)
+
+SessionDep = Annotated[Session, Depends(get_session)]
+logger = logging.getLogger('uvicorn.error')
+
+HISTOGRAM_BOUND_LIMIT = 1_000_000
+
+SNAPSHOT_NOTE = ("Served from an in-memory snapshot of the scores, rebuilt in the background a few seconds "
+                 "after student writes and at least once a minute.")
+
+
+@router.get(
+    "/students/{student_id}/rank",
+    summary="Get rank and percentile of a student in a subject",
+    description=SNAPSHOT_NOTE
+)
+def get_student_rank(
+        student_id: str,
+        subject: Subject,
+        session: SessionDep) -> StudentRankResponse:
+    logger.info(f"Get {subject.value} rank of student {student_id}")
+    snapshot = get_snapshot(session)
+    result = snapshot.rank(student_id, subject)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Student or score not found")
+    score, rank, percentile, total = result
+    return StudentRankResponse(
+        student_id=student_id,
+        subject=subject,
+        score=score,
+        rank=rank,
+        percentile=percentile,
+        total=total,
+        refreshed_at=snapshot.refreshed_at
+    )
+
+
+@router.get("/histogram", summary="Get score distribution of a subject", description=SNAPSHOT_NOTE)
+def get_histogram(
+        subject: Subject,
+        session: SessionDep,
+        bins: Annotated[int, Query(ge=1, le=100)] = 10,
+        low: Annotated[float, Query(ge=-HISTOGRAM_BOUND_LIMIT, le=HISTOGRAM_BOUND_LIMIT)] = 0.0,
+        high: Annotated[float, Query(ge=-HISTOGRAM_BOUND_LIMIT, le=HISTOGRAM_BOUND_LIMIT)] = 10.0,
+        home_town: str | None = None) -> HistogramResponse:
+    if low >= high:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="low must be less than high")
+
+    logger.info(f"Get {subject.value} histogram")
+    snapshot = get_snapshot(session)
+    try:
+        counts, edges = snapshot.histogram(subject, bins, low, high, home_town)
+    except ValueError as err:
+        logger.info(f"Invalid histogram range: {err}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid histogram range")
+    return HistogramResponse(
+        subject=subject,
+        home_town=home_town,
+        total=int(counts.sum()),
+        bins=[
+            HistogramBin(lower=float(edges[i]), upper=float(edges[i + 1]), count=int(count))
+            for i, count in enumerate(counts)
+        ],
+        refreshed_at=snapshot.refreshed_at
+    )
+
+
+@router.get("/top", summary="Get top students of a subject", description=SNAPSHOT_NOTE)
+def get_top_students(
+        subject: Subject,
+        session: SessionDep,
+        n: Annotated[int, Query(ge=1, le=1000)] = 10,
+        home_town: str | None = None) -> TopStudentsResponse:
+    logger.info(f"Get top {n} students in {subject.value}")
+    snapshot = get_snapshot(session)
+    indices = snapshot.top(subject, n, home_town)
+    column = snapshot.scores[subject]
+    return TopStudentsResponse(
+        subject=subject,
+        home_town=home_town,
+        students=[
+            TopStudent(
+                student_id=str(snapshot.student_ids[i]),
+                home_town=str(snapshot.home_towns[snapshot.home_town_codes[i]]),
+                score=float(column[i])
+            )
+            for i in indices
+        ],
+        refreshed_at=snapshot.refreshed_at
+    )
+
+
+@router.post("/refresh", summary="Rebuild the analytic snapshot from the database")
+def refresh_analytic_snapshot(session: SessionDep) -> SnapshotResponse:
+    logger.info("Refreshing analytic snapshot")
+    snapshot = refresh_snapshot(session)
+    return SnapshotResponse(
+        total=len(snapshot),
+        home_town_count=len(snapshot.home_towns),
+        refreshed_at=snapshot.refreshed_at
+    )
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlmodel import Session, select
 from starlette import status
 
+from analytics import mark_snapshot_stale
 from database import get_session
 from database.models.student import Student
 from schemas import StudentRequest, StudentResponse, ImportErrorDetails, StudentImportResponse
@@ -38,6 +39,7 @@ def create_student(
         session.add(student)
         session.commit()
         session.refresh(student)
+        mark_snapshot_stale()
 
         logger.info("Student created")
         return StudentResponse.model_validate(student)
@@ -63,6 +65,7 @@ def update_student(
         session.add(student)
         session.commit()
         session.refresh(student)
+        mark_snapshot_stale()
 
         logger.info("Student updated")
 
@@ -87,6 +90,7 @@ def delete_student(
             raise HTTPException(status_code=404, detail="Student not found")
         session.delete(student)
         session.commit()
+        mark_snapshot_stale()
         logger.info("Student deleted")
     except HTTPException:
         logger.info(f"Student {student_id} not found")
@@ -171,6 +175,9 @@ def import_students_from_csv(
                 error=str(err)
             ))
 
+    if success:
+        mark_snapshot_stale()
+
     return StudentImportResponse(
         total=len(success) + len(failed),
         success_count=len(success),
@@ -0,0 +1 @@
+# Makes the application packages importable from the tests folder.
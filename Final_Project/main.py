@@ -1,24 +1,33 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
-from api import student_api
-from contextlib import asynccontextmanager
+from api import student_api, analytics_api
+from contextlib import asynccontextmanager, suppress
 
+from analytics import refresh_snapshot_periodically
 from database import create_db_and_tables
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # create db and table on start up
     create_db_and_tables()
+    # keep the analytic score snapshot fresh in the background
+    refresh_task = asyncio.create_task(refresh_snapshot_periodically())
     yield
     # Clean up and release the resources
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
 
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(student_api.router)
+app.include_router(analytics_api.router)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
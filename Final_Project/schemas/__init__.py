@@ -1,4 +1,7 @@
 from .student_request import StudentRequest
 from .student_response import StudentResponse
 from .student_import_response import StudentImportResponse
-from .student_import_response import ImportErrorDetails
\ No newline at end of file
+from .student_import_response import ImportErrorDetails
+from .subject import Subject
+from .analytics_response import StudentRankResponse, HistogramBin, HistogramResponse
+from .analytics_response import TopStudent, TopStudentsResponse, SnapshotResponse
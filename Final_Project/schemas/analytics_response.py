@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from schemas.subject import Subject
+
+
+class StudentRankResponse(BaseModel):
+    student_id: str = Field(title="Student's ID", description="Student's ID")
+    subject: Subject = Field(title="Subject", description="Subject")
+    score: float = Field(title="Score", description="Student's score in the subject")
+    rank: int = Field(title="Rank", description="1-based rank, students with equal scores share a rank")
+    percentile: float = Field(title="Percentile", description="Percentage of scored students at or below this score")
+    total: int = Field(title="Total scored students", description="Number of students having a score in the subject")
+    refreshed_at: datetime = Field(title="Snapshot time", description="Time the analytic snapshot was built")
+
+
+class HistogramBin(BaseModel):
+    lower: float = Field(title="Lower edge", description="Inclusive lower edge of the bin")
+    upper: float = Field(title="Upper edge", description="Upper edge of the bin, inclusive for the last bin")
+    count: int = Field(title="Count", description="Number of students in the bin")
+
+
+class HistogramResponse(BaseModel):
+    subject: Subject = Field(title="Subject", description="Subject")
+    home_town: str | None = Field(default=None, title="Hometown", description="Hometown filter")
+    total: int = Field(title="Total scored students", description="Number of students counted")
+    bins: list[HistogramBin] = Field(title="Bins", description="Histogram bins")
+    refreshed_at: datetime = Field(title="Snapshot time", description="Time the analytic snapshot was built")
+
+
+class TopStudent(BaseModel):
+    student_id: str = Field(title="Student's ID", description="Student's ID")
+    home_town: str = Field(title="Hometown", description="Hometown")
+    score: float = Field(title="Score", description="Student's score in the subject")
+
+
+class TopStudentsResponse(BaseModel):
+    subject: Subject = Field(title="Subject", description="Subject")
+    home_town: str | None = Field(default=None, title="Hometown", description="Hometown filter")
+    students: list[TopStudent] = Field(title="Students", description="Students ordered by score descending")
+    refreshed_at: datetime = Field(title="Snapshot time", description="Time the analytic snapshot was built")
+
+
+class SnapshotResponse(BaseModel):
+    total: int = Field(title="Total students", description="Number of students in the snapshot")
+    home_town_count: int = Field(title="Hometowns", description="Number of distinct hometowns")
+    refreshed_at: datetime = Field(title="Snapshot time", description="Time the analytic snapshot was built")
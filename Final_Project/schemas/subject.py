@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Subject(str, Enum):
+    math = "math_score"
+    literature = "literature_score"
+    english = "english_score"
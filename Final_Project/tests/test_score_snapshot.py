@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from analytics import ScoreSnapshot
+from schemas import Subject
+
+
+def build_snapshot(rows: list[tuple[str, str, float | None]]) -> ScoreSnapshot:
+    """Snapshot from (student_id, home_town, math_score) rows, other subjects left empty."""
+    rows = sorted(rows)
+    home_towns, codes = np.unique(np.array([row[1] for row in rows], dtype=str), return_inverse=True)
+    math = np.array([row[2] for row in rows], dtype=np.float64)
+    scores = {
+        Subject.math: math,
+        Subject.literature: np.full(len(rows), np.nan),
+        Subject.english: np.full(len(rows), np.nan),
+    }
+    return ScoreSnapshot(np.array([row[0] for row in rows], dtype=str), codes.astype(np.int32), home_towns, scores)
+
+
+@pytest.fixture
+def snapshot() -> ScoreSnapshot:
+    return build_snapshot([
+        ("S1", "Ha Noi", 9.0),
+        ("S2", "Hai Phong", 8.0),
+        ("S3", "Ha Noi", 8.0),
+        ("S4", "Hai Phong", 8.0),
+        ("S5", "Ha Noi", 5.0),
+        ("S6", "Ha Noi", None),
+    ])
+
+
+def test_top_keeps_ties_ordered_by_student_id(snapshot):
+    indices = snapshot.top(Subject.math, 3)
+    assert list(snapshot.student_ids[indices]) == ["S1", "S2", "S3"]
+
+
+def test_top_filters_by_home_town(snapshot):
+    indices = snapshot.top(Subject.math, 10, "Ha Noi")
+    assert list(snapshot.student_ids[indices]) == ["S1", "S3", "S5"]
+
+
+def test_unknown_home_town_matches_nothing(snapshot):
+    assert len(snapshot.top(Subject.math, 10, "Nowhere")) == 0
+    counts, _ = snapshot.histogram(Subject.math, 10, 0.0, 10.0, "Nowhere")
+    assert counts.sum() == 0
+
+
+def test_rank_shares_rank_on_ties_and_skips_nan(snapshot):
+    assert snapshot.rank("S1", Subject.math) == (9.0, 1, 100.0, 5)
+    assert snapshot.rank("S3", Subject.math) == (8.0, 2, 80.0, 5)
+    assert snapshot.rank("S5", Subject.math) == (5.0, 5, 20.0, 5)
+    assert snapshot.rank("S6", Subject.math) is None
+    assert snapshot.rank("S7", Subject.math) is None
+
+
+def test_histogram_ignores_nan(snapshot):
+    counts, edges = snapshot.histogram(Subject.math, 2, 0.0, 10.0)
+    assert list(counts) == [0, 5]
+    assert list(edges) == [0.0, 5.0, 10.0]
+
+
+def test_empty_snapshot():
+    empty = build_snapshot([])
+    assert len(empty) == 0
+    assert empty.rank("S1", Subject.math) is None
+    assert len(empty.top(Subject.math, 5)) == 0
+    assert len(empty.top(Subject.math, 5, "Ha Noi")) == 0
+    counts, _ = empty.histogram(Subject.math, 5, 0.0, 10.0)
+    assert counts.sum() == 0
+
+
+@pytest.mark.parametrize(("params", "expected_status"), [
+    ({"low": "nan"}, 422),
+    ({"high": "inf"}, 422),
+    ({"low": "-inf"}, 422),
+    ({"low": "-1e308", "high": "1e308"}, 422),
+    ({"low": "5", "high": "5"}, 400),
+    ({"low": "6", "high": "5"}, 400),
+])
+def test_histogram_rejects_invalid_bounds(params, expected_status):
+    client = TestClient(main.app)
+    response = client.get("/v1/api/analytics/histogram", params={"subject": "math_score", **params})
+    assert response.status_code == expected_status